@@ -18,7 +18,7 @@ import hashlib
 import ssl
 import sys
 import typing
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 # import pymonetdb
 from pymonetdb.exceptions import OperationalError, DatabaseError, \
@@ -480,7 +480,7 @@ class Connection(object):
             # don't care
             pass
 
-    def cmd(self, operation: str):  # noqa: C901
+    def cmd(self, operation: str):
         """ put a mapi command on the line"""
         logger.debug("executing command %s" % operation)
 
@@ -489,6 +489,41 @@ class Connection(object):
 
         self._putblock(operation)
         response = self._getblock_and_transfer_files()
+        return self._process_response(response)
+
+    def cmd_pipelined(self, operations: List[str]) -> List[str]:
+        """ put several mapi commands on the line at once and only then
+        collect the responses, so they take a single round trip. Only use
+        this for commands that are complete in themselves, such as the X
+        commands, the server must never ask for more input.
+
+        Returns the responses like cmd() would. If one of the commands
+        fails, the remaining responses are still read before the first
+        error is raised.
+        """
+        logger.debug("executing pipelined commands %s" % operations)
+
+        if self.state != STATE_READY:
+            raise ProgrammingError("Not connected")
+
+        for operation in operations:
+            self._putblock(operation)
+        responses = []
+        error = None
+        for _ in operations:
+            response = self._getblock_and_transfer_files()
+            try:
+                responses.append(self._process_response(response))
+            except Exception as e:
+                responses.append("")
+                error = error or e
+        if error:
+            raise error
+        return responses
+
+    def _process_response(self, response: str):  # noqa: C901
+        """ check a mapi response for errors and strip the protocol
+        specific parts"""
         if not len(response):
             return ""
         elif response.startswith(MSG_OK):
@@ -525,6 +560,51 @@ class Connection(object):
         else:
             raise ProgrammingError("unknown state: %s" % response)
 
+    def cmd_iter(self, operation: str) -> Iterator[List[str]]:  # noqa: C901
+        """ put a mapi command on the line, and yield the lines of the
+        response in batches while it is still being received.
+
+        For regular responses, concatenating the batches gives
+        cmd(operation).split('\\n'). Error responses are raised as
+        exceptions. The iterator must be exhausted or closed before the
+        next operation on this Connection object, closing it early
+        discards the rest of the response.
+        """
+        logger.debug("executing command %s" % operation)
+
+        if self.state != STATE_READY:
+            raise ProgrammingError("Not connected")
+
+        self._putblock(operation)
+        buffer = self._get_buffer()
+        offset, last = self._get_minor_block(buffer, 0)
+        try:
+            if buffer[0:len(MSG_ERROR_B)] == MSG_ERROR_B:
+                while not last:
+                    offset, last = self._get_minor_block(buffer, offset)
+                exception, msg = handle_error(str(memoryview(buffer)[1:offset], 'utf-8'))
+                raise exception(msg)
+            while True:
+                # yield the complete lines, keep the incomplete one for later
+                end = offset if last else buffer.rfind(b'\n', 0, offset)
+                if end >= 0:
+                    lines = str(memoryview(buffer)[:end], 'utf-8').split('\n')
+                    remaining = offset - end - 1
+                    if remaining > 0:
+                        buffer[:remaining] = buffer[end + 1:offset]
+                    offset = max(remaining, 0)
+                    yield lines
+                if last:
+                    break
+                offset, last = self._get_minor_block(buffer, offset)
+        except GeneratorExit:
+            # closed early, skip the rest of the response
+            while not last:
+                _, last = self._get_minor_block(buffer, 0)
+            raise
+        finally:
+            self._stash_buffer(buffer)
+
     def binary_cmd(self, operation: str) -> memoryview:
         """ put a mapi command on the line, with a binary response.
 
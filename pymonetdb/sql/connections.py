@@ -219,6 +219,18 @@ class Connection:
         self.__mapi_check()
         return self.mapi.cmd(command)
 
+    def command_pipelined(self, commands):
+        """ use this function to send several low level mapi commands
+        without waiting for each response in turn"""
+        self.__mapi_check()
+        return self.mapi.cmd_pipelined(commands)
+
+    def command_iter(self, command):
+        """ use this function to send low level mapi commands and process
+        the lines of the response while it is still being received"""
+        self.__mapi_check()
+        return self.mapi.cmd_iter(command)
+
     def binary_command(self, command):
         """ use this function to send low level mapi commands that return raw bytes"""
         self.__mapi_check()
@@ -6,8 +6,9 @@
 
 import logging
 from collections import namedtuple
+import re
 import struct
-from typing import List, Optional, Dict, Tuple, Type
+from typing import Iterator, List, Optional, Dict, Sequence, Tuple, Type
 from pymonetdb.policy import BatchPolicy
 import pymonetdb.sql.connections
 from pymonetdb.sql.debug import debug, export
@@ -17,10 +18,59 @@ from pymonetdb import mapi
 
 logger = logging.getLogger("pymonetdb")
 
+# executemany() sends a batch of statements once it holds this many characters
+EXECUTEMANY_BATCH_LENGTH = 1024 * 1024
+
+# the affected rows of an &2 line and the total rows of an &1 line
+_ROWCOUNT_PATTERN = re.compile(r'^&(?:2|1 \S+) (-?\d+)', re.MULTILINE)
+
 Description = namedtuple('Description', ('name', 'type_code', 'display_size', 'internal_size', 'precision', 'scale',
                                          'null_ok'))
 
 
+def _split_in_batches(block: str, batch_size: int = 65536) -> Iterator[List[str]]:
+    """Yield the lines of block in batches of roughly batch_size characters.
+    Together the batches are equal to block.split("\\n") but there is never a
+    list of all lines at once."""
+    start = 0
+    while True:
+        end = block.find("\n", start + batch_size)
+        if end < 0:
+            yield block[start:].split("\n")
+            return
+        yield block[start:end].split("\n")
+        start = end + 1
+
+
+class _ColumnarRows(Sequence[Tuple]):
+    """Sequence of rows backed by a list of columns. The row tuples are only
+    built when they are accessed."""
+
+    def __init__(self, cols: List[list]):
+        self._cols = cols
+        self._len = len(cols[0]) if cols else 0
+
+    def extend(self, cols: List[list]):
+        """Append the values of the given columns"""
+        # Growing the columns with list.extend() is cheaper than allocating
+        # [None] * rows_to_fetch up front and assigning slices, so the
+        # columns are not preallocated.
+        if not self._cols:
+            self._cols = cols
+        else:
+            for col, values in zip(self._cols, cols):
+                col.extend(values)
+        self._len += len(cols[0]) if cols else 0
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(zip(*[col[i] for col in self._cols]))
+        return tuple([col[i] for col in self._cols])
+
+
 class Cursor(object):
     """This object represents a database cursor, which is used to manage
     the context of a fetch operation. Cursors created from the same
@@ -36,20 +86,25 @@ class Cursor(object):
     """Default value for the size parameter of :func:`~pymonetdb.sql.cursors.Cursor.fetchmany`. """
 
     rowcount: int
-    description: Optional[List[Description]]
+    _header: Optional[List[list]]
+    _description: Optional[List[Description]]
+    _col_types: List[Optional[str]]
     _can_bindecode: Optional[bool]
     _bindecoders: Optional[List['pythonizebin.BinaryDecoder']]
     rownumber: int
     _executed: Optional[str]
     _offset: int
-    _rows: List[Tuple]
+    _rows: Sequence[Tuple]
     _resultsets_to_close: List[str]
     _query_id: Optional[str]
     messages: List[Tuple[Type[Exception], str]]
     lastrowid: Optional[int]
-    _unpack_int64: str
+    _server_endian: str
+    _byte_order: str
+    _int64: struct.Struct
+    _toc: Optional[struct.Struct]
 
-    _next_result_sets: List[Tuple[str, int, List[Description], List[Tuple]]]
+    _next_result_sets: List[Tuple[str, int, List[list], Sequence[Tuple]]]
 
     def __init__(self, connection: 'pymonetdb.sql.connections.Connection'):
         """This read-only attribute return a reference to the Connection
@@ -74,24 +129,16 @@ class Cursor(object):
         # operation is cannot be determined by the interface.
         self.rowcount = -1
 
-        # This read-only attribute is a sequence of 7-item
-        # sequences.
-        #
-        # Each of these sequences contains information describing
-        # one result column:
-        #
-        #   (name,
-        #    type_code,
-        #    display_size,
-        #    internal_size,
-        #    precision,
-        #    scale,
-        #    null_ok)
-        #
-        # This attribute will be None for operations that
-        # do not return rows or if the cursor has not had an
-        # operation invoked via the .execute*() method yet.
-        self.description = None
+        # The column names, types, internal sizes, precisions and scales of
+        # the current result set as received from the server, or None if
+        # there is no result set. The description is built from this when
+        # it is first asked for.
+        self._header = None
+        self._description = None
+
+        # The type codes from the header, used when converting
+        # text result sets
+        self._col_types = []
 
         # When the opportunity presents itself to fetch a result set in binary
         # we need to know if we can handle the result and if so, how.
@@ -99,6 +146,7 @@ class Cursor(object):
         # These attributes are cleared by execute() and set by _nextchunk()
         self._can_bindecode = None
         self._bindecoders = None
+        self._toc = None
 
         # This read-only attribute indicates at which row
         # we currently are
@@ -150,19 +198,47 @@ class Cursor(object):
         # This is used to unpack binary result sets
         server_endian = self.connection.mapi.server_endian
         if server_endian == 'little':
-            unpacker = '<q'
+            byte_order = '<'
         elif server_endian == 'big':
-            unpacker = '>q'
-        self._unpack_int64 = unpacker
+            byte_order = '>'
+        self._server_endian = server_endian
+        self._byte_order = byte_order
+        self._int64 = struct.Struct(byte_order + 'q')
+
+    @property
+    def description(self) -> Optional[List[Description]]:
+        """This read-only attribute is a sequence of 7-item sequences.
+
+        Each of these sequences contains information describing one result
+        column: (name, type_code, display_size, internal_size, precision,
+        scale, null_ok).
+
+        This attribute will be None for operations that do not return rows
+        or if the cursor has not had an operation invoked via the
+        .execute*() method yet."""
+        if self._description is None and self._header is not None:
+            if self._header:
+                (names, types, internal_sizes, precisions, scales) = self._header
+                # the server never sends display_size and null_ok
+                self._description = [
+                    Description(name, type_code, None, internal_size, precision, scale, None)
+                    for (name, type_code, internal_size, precision, scale)
+                    in zip(names, types, internal_sizes, precisions, scales)
+                ]
+            else:
+                self._description = []
+        return self._description
 
     def _check_executed(self):
         if not self._executed:
             self._exception_handler(ProgrammingError, "do a execute() first")
 
     def _close_earlier_resultsets(self):
-        for rs in self._resultsets_to_close:
-            command = 'Xclose %s' % rs
-            self.connection.command(command)
+        if self._resultsets_to_close:
+            # the server only handles one Xclose per message, but they
+            # can all be sent before waiting for the responses
+            commands = ['Xclose %s' % rs for rs in self._resultsets_to_close]
+            self.connection.command_pipelined(commands)
         del self._resultsets_to_close[:]
 
     def close(self):
@@ -192,12 +268,55 @@ class Cursor(object):
         # Propagate any errors
         return False
 
-    def execute(self, operation: str, parameters: Optional[Dict] = None):  # noqa C901
+    def execute(self, operation: str, parameters: Optional[Dict] = None):
         """Prepare and execute a database operation (query or
         command).  Parameters may be provided as mapping and
         will be bound to variables in the operation.
         """
 
+        self._start_execute(operation)
+        query = self._interpolate(operation, parameters)
+        self._execute_query(operation, query)
+        return self.rowcount if self.rowcount >= 0 else None
+
+    def executemany(self, operation, seq_of_parameters):
+        """Prepare a database operation (query or command) and then
+        execute it against all parameter sequences or mappings
+        found in the sequence seq_of_parameters.
+
+        The statements are sent to the server in batches, each batch as a
+        single multi-statement query.
+
+        It will return the number or rows affected
+        """
+
+        count = 0
+        if pymonetdb.paramstyle != 'pyformat':
+            # the named parameters are appended to the statement,
+            # keep those statements separate
+            for parameters in seq_of_parameters:
+                count += self.execute(operation, parameters)
+            self.rowcount = count
+            return count
+
+        queries = []
+        length = 0
+        for parameters in seq_of_parameters:
+            query = self._interpolate(operation, parameters)
+            queries.append(query)
+            length += len(query)
+            if length >= EXECUTEMANY_BATCH_LENGTH:
+                count += self._execute_batch(operation, queries)
+                queries = []
+                length = 0
+        if queries:
+            count += self._execute_batch(operation, queries)
+        self.rowcount = count
+        return count
+
+    def _start_execute(self, operation: str):
+        """Get the cursor and the connection ready for a new query"""
+
         if not self.connection:
             self._exception_handler(ProgrammingError, "cursor is closed")
 
@@ -218,6 +337,9 @@ class Cursor(object):
         else:
             self.operation = operation
 
+    def _interpolate(self, operation: str, parameters) -> str:
+        """Bind the parameters to the variables in the operation"""
+
         query = ""
         if parameters:
             if isinstance(parameters, dict):
@@ -232,8 +354,7 @@ class Cursor(object):
                         args.append('%s %s' % (k, monetize.convert(v)))
                     query = operation + ' : ( ' + ','.join(args) + ' )'
             elif isinstance(parameters, list) or isinstance(parameters, tuple):
-                query = operation % tuple(
-                    [monetize.convert(item) for item in parameters])
+                query = operation % tuple(map(monetize.convert, parameters))
             elif isinstance(parameters, str):
                 query = operation % monetize.convert(parameters)
             else:
@@ -241,26 +362,28 @@ class Cursor(object):
                 self._exception_handler(ValueError, msg % type(parameters))
         else:
             query = operation
+        return query
+
+    def _execute_query(self, operation: str, query: str) -> str:
+        """Send the query to the server and process the result, returns the
+        raw mapi response"""
 
         block = self.connection.execute(query)
         self._store_result(block, update_existing=False)
         self.nextset()
         self._executed = operation
-        return self.rowcount if self.rowcount >= 0 else None
+        return block
 
-    def executemany(self, operation, seq_of_parameters):
-        """Prepare a database operation (query or command) and then
-        execute it against all parameter sequences or mappings
-        found in the sequence seq_of_parameters.
+    def _execute_batch(self, operation: str, queries: List[str]) -> int:
+        """Execute the queries as a single multi-statement query, returns the
+        total number of rows they affected or produced"""
 
-        It will return the number or rows affected
-        """
-
-        count = 0
-        for parameters in seq_of_parameters:
-            count += self.execute(operation, parameters)
-        self.rowcount = count
-        return count
+        self._start_execute(operation)
+        # the same statement separator as Connection.execute() appends,
+        # so a trailing -- comment cannot swallow the next statement
+        block = self._execute_query(operation, '\n;\n'.join(queries))
+        counts = (int(n) for n in _ROWCOUNT_PATTERN.findall(block))
+        return sum(n for n in counts if n > 0)
 
     def debug(self, query, fname, sample=-1):
         """ Locally debug a given Python UDF function in a SQL query
@@ -281,15 +404,18 @@ class Cursor(object):
             msg = "query didn't result in a resultset"
             self._exception_handler(ProgrammingError, msg)
 
-        cache_end = self._offset + len(self._rows)
-        if self.rownumber >= cache_end:
-            if self.rownumber >= self.rowcount:
+        rownumber = self.rownumber
+        rows = self._rows
+        offset = self._offset
+        if rownumber >= offset + len(rows):
+            if rownumber >= self.rowcount:
                 return None
-            self._populate_cache(0, self.rownumber + 1)
+            self._populate_cache(0, rownumber + 1)
+            rows = self._rows
+            offset = self._offset
 
-        result = self._rows[self.rownumber - self._offset]
-        self.rownumber += 1
-        return result
+        self.rownumber = rownumber + 1
+        return rows[rownumber - offset]
 
     def fetchmany(self, size=None):
         """Fetch the next set of rows of a query result, returning a
@@ -312,18 +438,21 @@ class Cursor(object):
         if size is None:
             size = self.arraysize
 
-        cache_end = self._offset + len(self._rows)
-        requested_end = min(self.rownumber + size, self.rowcount)
+        rownumber = self.rownumber
+        rows = self._rows
+        offset = self._offset
+        cache_end = offset + len(rows)
+        requested_end = min(rownumber + size, self.rowcount)
 
         if requested_end <= cache_end:
-            result = self._rows[self.rownumber - self._offset:requested_end - self._offset]
-            self.rownumber = requested_end
-        else:
-            result = self._rows[self.rownumber - self._offset:cache_end - self._offset]
-            self.rownumber = cache_end
-            self._populate_cache(len(result), requested_end)
-            result += self._rows[self.rownumber - self._offset:requested_end - self._offset]
             self.rownumber = requested_end
+            return rows[rownumber - offset:requested_end - offset]
+
+        result = rows[rownumber - offset:cache_end - offset]
+        self.rownumber = cache_end
+        self._populate_cache(len(result), requested_end)
+        result += self._rows[cache_end - self._offset:requested_end - self._offset]
+        self.rownumber = requested_end
 
         return result
 
@@ -341,19 +470,22 @@ class Cursor(object):
         if not self._next_result_sets:
             return None
 
-        (self._query_id, self.rowcount, self.description, self._rows) = self._next_result_sets[0]
+        (self._query_id, self.rowcount, self._header, self._rows) = self._next_result_sets[0]
         del self._next_result_sets[0]
+        self._description = None
+        self._col_types = self._header[1] if self._header else []
 
         self._policy.new_query()
         self._offset = 0
         self.rownumber = 0
         self._can_bindecode = None
         self._bindecoders = None
+        self._toc = None
 
         return True
 
     def _populate_cache(self, already_used, requested_end):
-        del self._rows[:]
+        self._rows = []
         self._offset = self.rownumber
 
         rows_to_fetch = self._policy.batch_size(
@@ -369,8 +501,13 @@ class Cursor(object):
             self._store_binary_result(binary_block)
         else:
             command = 'Xexport %s %s %s' % (self._query_id, self.rownumber, rows_to_fetch)
-            block = self.connection.command(command)
-            self._store_result(block, update_existing=True)
+            # parse the rows while the rest of the response is still coming in
+            batches = self.connection.command_iter(command)
+            try:
+                if not self._store_result_lines(batches, update_existing=True):
+                    self._exception_handler(InterfaceError, "Unknown state, response ended without prompt")
+            finally:
+                batches.close()
 
     def _check_bindecode_possible(self):
         self._can_bindecode = False
@@ -385,6 +522,8 @@ class Cursor(object):
         # if we get here, all columns have a decoder
         self._can_bindecode = True
         self._bindecoders = decoders
+        # the toc holds a (start, length) pair for each column
+        self._toc = struct.Struct('%s%dq' % (self._byte_order, 2 * len(decoders)))
 
     def setinputsizes(self, sizes):
         """
@@ -410,188 +549,235 @@ class Cursor(object):
             raise StopIteration
         return row
 
-    def __next__(self):
-        return self.next()
+    # iterating over the cursor calls fetchone() without going through an
+    # extra method call for every row
+    __next__ = next
 
-    def _store_result(self, block, *, update_existing: bool):  # noqa: C901
+    def _store_result(self, block, *, update_existing: bool):
         """ parses the mapi result into a resultset"""
 
-        if not update_existing:
-            self._next_result_sets = []
-
         if not block:
             block = ""
 
+        if not self._store_result_lines(_split_in_batches(block), update_existing=update_existing):
+            self._exception_handler(InterfaceError, "Unknown state, %s" % block)
+
+    def _store_result_lines(self, batches, *, update_existing: bool) -> bool:  # noqa: C901
+        """ parses the lines of a mapi result, which are given in batches,
+        into a resultset. Returns False if the prompt was not found."""
+
+        if not update_existing:
+            self._next_result_sets = []
+
         columns = 0
         column_name: List[Optional[str]] = []
         scale: List[Optional[int]] = []
-        display_size: List[Optional[int]] = []
         internal_size: List[Optional[int]] = []
         precision: List[Optional[int]] = []
-        null_ok: List[Optional[bool]] = []
         type_: List[Optional[str]] = []
 
+        # Lines are classified by their first character, and for the '&'
+        # lines by their first two characters.
         msg_tuple = mapi.MSG_TUPLE
         assert len(msg_tuple) == 1
         msg_header = mapi.MSG_HEADER
         assert len(msg_header) == 1
 
-        for line in block.split("\n"):
-            first = line[:1]
-
-            if first == msg_tuple:
-                self._rows.append(self._parse_tuple(line))
-
-            elif first == msg_header:
-                (data, identity) = line[1:].split("#")
-                values = [x.strip() for x in data.split(",")]
-                identity = identity.strip()
-
-                if identity == "name":
-                    column_name = values
-                elif identity == "table_name":
-                    _ = values  # not used
-                elif identity == "type":
-                    type_ = values
-                elif identity == "length":
-                    _ = values  # not used
-                elif identity == "typesizes":
-                    typesizes = [[int(j) for j in i.split()] for i in values]
-                    internal_size = [x[0] for x in typesizes]
-                    for num, typeelem in enumerate(type_):
-                        if typeelem in ['decimal']:
-                            precision[num] = typesizes[num][0]
-                            scale[num] = typesizes[num][1]
-                else:
-                    msg = "unknown header field: {}".format(identity)
-                    logger.warning(msg)
-                    self.messages.append((Warning, msg))
-
-                description = self.description if self.description is not None else []
-                description[:] = []
-                for i in range(columns):
-                    description.append(Description(column_name[i], type_[i], display_size[i], internal_size[i],
-                                                   precision[i], scale[i], null_ok[i]))
-                self.description = description
-                self._offset = 0
-
-            elif line.startswith(mapi.MSG_INFO):
-                logger.info(line[1:])
-                self.messages.append((Warning, line[1:]))
-
-            elif line.startswith(mapi.MSG_QTABLE) or line.startswith(mapi.MSG_QPREPARE):
-                query_id, rowcount, columns, tuples = line[2:].split()[:4]
-                self._query_id = query_id
-
-                columns = int(columns)  # number of columns in result
-                tuples = int(tuples)     # number of rows in this set
-                if tuples < self.rowcount:
-                    self._resultsets_to_close.append(query_id)
-
-                self.description = []
-                self.rowcount = int(rowcount)  # total number of rows
-                self._rows = []
-                if not update_existing:
-                    self._next_result_sets.append((query_id, self.rowcount, self.description, self._rows))
-
-                # set up fields for description
-                # table_name = [None] * columns
-                column_name = [None] * columns
-                type_ = [None] * columns
-                display_size = [None] * columns
-                internal_size = [None] * columns
-                precision = [None] * columns
-                scale = [None] * columns
-                null_ok = [None] * columns
-                # typesizes = [(0, 0)] * columns
-
-                self._offset = 0
-                if line.startswith(mapi.MSG_QPREPARE):
-                    self.lastrowid = int(query_id)
-                else:
+        # rows of the current result set, self._rows is set to this
+        # whenever a new result set starts
+        rows = _ColumnarRows([])
+        if update_existing:
+            self._rows = rows
+
+        # tuples are collected and converted column by column once the
+        # run of tuple lines ends
+        tuple_lines: List[str] = []
+
+        # the header of the current result set, filled in once the last
+        # header line has been seen
+        header: List[list] = []
+        in_header = False
+
+        for lines in batches:
+            for line in lines:
+                first = line[:1]
+
+                if in_header and first != msg_header:
+                    header[:] = [column_name, type_, internal_size, precision, scale]
+                    self._header = header
+                    self._description = None
+                    self._col_types = type_
+                    self._offset = 0
+                    in_header = False
+
+                if first == msg_tuple:
+                    tuple_lines.append(line)
+                    continue
+
+                if tuple_lines:
+                    rows.extend(self._parse_tuples(tuple_lines))
+                    tuple_lines = []
+
+                kind = line[:2]
+
+                if first == msg_header:
+                    in_header = True
+                    (data, identity) = line[1:].split("#")
+                    values = [x.strip() for x in data.split(",")]
+                    identity = identity.strip()
+
+                    if identity == "name":
+                        column_name = values
+                    elif identity == "table_name":
+                        _ = values  # not used
+                    elif identity == "type":
+                        type_ = values
+                    elif identity == "length":
+                        _ = values  # not used
+                    elif identity == "typesizes":
+                        typesizes = [[int(j) for j in i.split()] for i in values]
+                        internal_size = [x[0] for x in typesizes]
+                        if 'decimal' in type_:
+                            precision = [None] * columns
+                            scale = [None] * columns
+                            for num, typeelem in enumerate(type_):
+                                if typeelem == 'decimal':
+                                    precision[num] = typesizes[num][0]
+                                    scale[num] = typesizes[num][1]
+                    else:
+                        msg = "unknown header field: {}".format(identity)
+                        logger.warning(msg)
+                        self.messages.append((Warning, msg))
+
+                elif first == mapi.MSG_INFO:
+                    logger.info(line[1:])
+                    self.messages.append((Warning, line[1:]))
+
+                elif kind == mapi.MSG_QTABLE or kind == mapi.MSG_QPREPARE:
+                    query_id, rowcount, columns, tuples = line[2:].split()[:4]
+                    self._query_id = query_id
+
+                    columns = int(columns)  # number of columns in result
+                    tuples = int(tuples)     # number of rows in this set
+                    if tuples < self.rowcount:
+                        self._resultsets_to_close.append(query_id)
+
+                    self._header = header = []
+                    self._description = None
+                    self.rowcount = int(rowcount)  # total number of rows
+                    self._rows = rows = _ColumnarRows([])
+                    if not update_existing:
+                        self._next_result_sets.append((query_id, self.rowcount, header, self._rows))
+
+                    # set up fields for description
+                    # table_name = [None] * columns
+                    column_name = [None] * columns
+                    type_ = [None] * columns
+                    internal_size = [None] * columns
+                    # precision and scale only apply to decimals, they get their
+                    # own lists when the typesizes header contains any
+                    precision = scale = [None] * columns
+                    # typesizes = [(0, 0)] * columns
+
+                    self._offset = 0
+                    if kind == mapi.MSG_QPREPARE:
+                        self.lastrowid = int(query_id)
+                    else:
+                        self.lastrowid = None
+
+                elif first == mapi.MSG_TUPLE_NOSLICE:
+                    rows.extend([[line[1:]]])
+
+                elif kind == mapi.MSG_QBLOCK:
+                    self._rows = rows = _ColumnarRows([])
+
+                elif kind == mapi.MSG_QSCHEMA:
+                    self._offset = 0
+                    self.lastrowid = None
+                    self._rows = rows = _ColumnarRows([])
+                    self._header = None
+                    self._description = None
+                    self.rowcount = -1
+
+                elif kind == mapi.MSG_QUPDATE:
+                    (affected, identity) = line[2:].split()[:2]
+                    self._offset = 0
+                    self._rows = rows = _ColumnarRows([])
+                    self._header = None
+                    self._description = None
+                    self.rowcount = int(affected)
+                    self.lastrowid = int(identity)
+                    self._query_id = None
+
+                elif kind == mapi.MSG_QTRANS:
+                    self._offset = 0
                     self.lastrowid = None
+                    self._rows = rows = _ColumnarRows([])
+                    self._header = None
+                    self._description = None
+                    self.rowcount = -1
 
-            elif line.startswith(mapi.MSG_TUPLE_NOSLICE):
-                self._rows.append((line[1:],))
-
-            elif line.startswith(mapi.MSG_QBLOCK):
-                self._rows = []
-
-            elif line.startswith(mapi.MSG_QSCHEMA):
-                self._offset = 0
-                self.lastrowid = None
-                self._rows = []
-                self.description = None
-                self.rowcount = -1
-
-            elif line.startswith(mapi.MSG_QUPDATE):
-                (affected, identity) = line[2:].split()[:2]
-                self._offset = 0
-                self._rows = []
-                self.description = None
-                self.rowcount = int(affected)
-                self.lastrowid = int(identity)
-                self._query_id = None
-
-            elif line.startswith(mapi.MSG_QTRANS):
-                self._offset = 0
-                self.lastrowid = None
-                self._rows = []
-                self.description = None
-                self.rowcount = -1
-
-            elif line == mapi.MSG_PROMPT:
-                return
+                elif line == mapi.MSG_PROMPT:
+                    return True
+
+                elif first == mapi.MSG_ERROR:
+                    self._exception_handler(ProgrammingError, line[1:])
 
-            elif line.startswith(mapi.MSG_ERROR):
-                self._exception_handler(ProgrammingError, line[1:])
+            # convert the tuples received so far
+            if tuple_lines:
+                rows.extend(self._parse_tuples(tuple_lines))
+                tuple_lines = []
 
-        self._exception_handler(InterfaceError, "Unknown state, %s" % block)
+        return False
 
     def _store_binary_result(self, block: memoryview):
         assert self._bindecoders is not None
+        assert self._toc is not None
         if len(block) < 8:
             self._exception_handler(InterfaceError, "binary response too short")
 
-        toc_pos = struct.unpack_from(self._unpack_int64, block, len(block) - 8)[0]
+        toc_pos = self._int64.unpack_from(block, len(block) - 8)[0]
         if toc_pos < 0:
             # It actually points to the error message.
-            # The message ends at the first \x00.
-            bmsg = bytes(block[toc_pos:-8])
-            bmsg = bmsg.split(b'\x00', 1)[0]
+            # The message ends at the first \x00. The block starts at the
+            # beginning of the receive buffer so we can look for it there
+            # without copying the rest of the block.
+            start = max(len(block) + toc_pos, 0)
+            end = block.obj.find(b'\x00', start, len(block) - 8)   # type: ignore
+            if end < 0:
+                end = len(block) - 8
             try:
-                msg = str(bmsg, 'utf-8')
+                msg = str(block[start:end], 'utf-8')
             except UnicodeDecodeError:
                 self._exception_handler(InterfaceError, "invalid utf-8 in error message")
             self._exception_handler(ProgrammingError, msg)
 
         # if we get here toc_pos actually points to the toc.
-        ncols = len(self._bindecoders)
+        toc = self._toc.unpack_from(block, toc_pos)
+        starts = toc[0::2]
+        lengths = toc[1::2]
         cols = []
-        for i in range(ncols):
-            # TODO fix endianness
-            start_pos = toc_pos + 16 * i
-            length_pos = start_pos + 8
-            start = struct.unpack_from(self._unpack_int64, block, start_pos)[0]
-            length = struct.unpack_from(self._unpack_int64, block, length_pos)[0]
+        for decoder, start, length in zip(self._bindecoders, starts, lengths):
             slice = block[start:start + length]
-            decoder = self._bindecoders[i]
-            col = decoder.decode(self.connection.mapi.server_endian, slice)
+            col = decoder.decode(self._server_endian, slice)
             cols.append(col)
-        rows = list(zip(*cols))
-        self._rows = rows
+        self._rows = _ColumnarRows(cols)
 
-    def _parse_tuple(self, line):
+    def _parse_tuples(self, lines):
         """
-        parses a mapi data tuple, and returns a list of python types
+        parses a batch of mapi data tuples, and returns a list of columns
+        of python types
         """
-        elements = line[1:-1].split(',\t')
-        if len(elements) == len(self.description):
-            return tuple([pythonize.convert(element.strip(), description[1])
-                          for (element, description) in zip(elements,
-                                                            self.description)])
-        else:
+        types = self._col_types
+        ncols = len(types)
+        # Every line looks like '[ value,\tvalue,\tvalue\t]' and the values
+        # themselves never contain a raw tab or newline. This means that once
+        # the brackets are gone the lines can be joined and split in one go.
+        elements = ',\t'.join([line[1:-1] for line in lines]).split(',\t')
+        if len(elements) != ncols * len(lines):
             self._exception_handler(InterfaceError, "length of row doesn't match header")
+        return [pythonize.convert_column(list(map(str.strip, elements[i::ncols])), type_code)
+                for (i, type_code) in enumerate(types)]
 
     def scroll(self, value, mode='relative'):
         """
@@ -116,10 +116,10 @@ def convert(data):
     """
     Return the appropriate convertion function based upon the python type.
     """
-    if type(data) in mapping_dict:
-        return mapping_dict[type(data)](data)
-    else:
-        for type_, func in mapping:
-            if issubclass(type(data), type_):
-                return func(data)
+    func = mapping_dict.get(type(data))
+    if func is not None:
+        return func(data)
+    for type_, func in mapping:
+        if issubclass(type(data), type_):
+            return func(data)
     raise ProgrammingError("type %s not supported as value" % type(data))
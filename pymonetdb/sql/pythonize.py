@@ -200,6 +200,18 @@ def convert(data, type_code):
         raise ProgrammingError("type %s is not supported" % type_code)
 
 
+def convert_column(data, type_code):
+    """
+    Converts a list of fields that all have the same type. The conversion
+    function is looked up once for the whole column rather than per field.
+    """
+    conv = mapping.get(type_code)
+    if conv is None:
+        # let convert() decide, it only complains about non-NULL values
+        return [convert(x, type_code) for x in data]
+    return [None if x == "NULL" else conv(x) for x in data]
+
+
 # below stuff required by the DBAPI
 
 def Binary(data):
@@ -40,6 +40,22 @@ assert FLOAT_WIDTH_TO_ARRAY_TYPE[32] == 'f'
 assert FLOAT_WIDTH_TO_ARRAY_TYPE[64] == 'd'
 
 
+def _structs(fmt: str):
+    """Precompile fmt for both server byte orders"""
+    return {
+        'little': struct.Struct('<' + fmt),
+        'big': struct.Struct('>' + fmt),
+    }
+
+
+# micros, second, minute, hour, padding, day, month, year
+TIMESTAMP_STRUCTS = _structs('IBBBxBBh')
+# micros, second, minute, hour, padding
+TIME_STRUCTS = _structs('IBBBx')
+# day, month, year
+DATE_STRUCTS = _structs('BBh')
+
+
 class BinaryDecoder:
     @abstractmethod
     def decode(self, server_endian: str, data: memoryview) -> List[Any]:
@@ -65,6 +81,12 @@ class IntegerDecoder(BinaryDecoder):
         if server_endian != sys.byteorder:
             arr.byteswap()
         null_value = self.null_value
+        if null_value not in arr:
+            # no NULLs, so the values need not be inspected one by one
+            if self.mapper:
+                return list(map(self.mapper, arr))
+            else:
+                return arr.tolist()
         if self.mapper:
             m = self.mapper
             values = [None if v == null_value else m(v) for v in arr]
@@ -129,7 +151,12 @@ class FloatDecoder(BinaryDecoder):
         arr.frombytes(data)
         if server_endian != sys.byteorder:
             arr.byteswap()
-        values = [None if isnan(v) else v for v in arr]
+        values: List[Any] = arr.tolist()
+        # The sum is NaN if any of the values is NaN (NULL). It can also be
+        # NaN without NULLs, for example inf + -inf, but then we merely take
+        # the slow path.
+        if isnan(sum(values)):
+            values = [None if isnan(v) else v for v in values]
         return values
 
 
@@ -176,19 +203,10 @@ class TimestampDecoder(BinaryDecoder):
         else:
             utczone = timezone.utc
             ourzone = timezone(timedelta(seconds=self.seconds_east))
-        # this is going to be dreadfully slow
         result = []
 
-        for i in range(0, len(data), 12):
-            rec = data[i:i + 12]
-            micros = int.from_bytes(rec[0:4], server_endian, signed=False)   # type: ignore
-            second = int(rec[4])
-            minute = int(rec[5])
-            hour = int(rec[6])
-            # byte 7 is padding
-            day = int(rec[8])
-            month = int(rec[9])
-            year = int.from_bytes(rec[10:12], server_endian, signed=True)   # type: ignore
+        records = TIMESTAMP_STRUCTS[server_endian].iter_unpack(data)
+        for (micros, second, minute, hour, day, month, year) in records:
             if micros < 1e6:
                 ts = datetime(year, month, day, hour, minute, second, micros, tzinfo=utczone)
                 if ourzone:
@@ -213,16 +231,9 @@ class TimeDecoder(BinaryDecoder):
         else:
             ourzone = timezone(timedelta(seconds=self.seconds_east))
             delta = int(timedelta(seconds=self.seconds_east).total_seconds())
-        # this is going to be dreadfully slow
         result = []
 
-        for i in range(0, len(data), 8):
-            rec = data[i:i + 12]
-            micros = int.from_bytes(rec[0:4], server_endian, signed=False)   # type: ignore
-            second = int(rec[4])
-            minute = int(rec[5])
-            hour = int(rec[6])
-            # byte 7 is padding
+        for (micros, second, minute, hour) in TIME_STRUCTS[server_endian].iter_unpack(data):
             if micros < 1e6:
                 if delta:
                     adjusted = (3600 * hour + 60 * minute + second + delta) % 86400
@@ -241,11 +252,7 @@ class DateDecoder(BinaryDecoder):
     def decode(self, server_endian: str, data: memoryview) -> List[Any]:
         result = []
 
-        for i in range(0, len(data), 4):
-            rec = data[i:i + 4]
-            day = int(rec[0])
-            month = int(rec[1])
-            year = int.from_bytes(rec[2:4], server_endian, signed=True)   # type: ignore
+        for (day, month, year) in DATE_STRUCTS[server_endian].iter_unpack(data):
             if month <= 12:
                 d = date(year, month, day)
             else:
@@ -6,6 +6,7 @@
 
 from unittest import TestCase
 import pymonetdb
+import pymonetdb.sql.cursors
 from tests.util import test_args
 
 
@@ -36,3 +37,29 @@ class ExecuteTests(TestCase):
         self.assertIsNone(ret)
 
         conn.rollback()
+
+    def test_executemany_return_value(self):
+        conn = pymonetdb.connect(**test_args)
+        c = conn.cursor()
+
+        c.execute("DROP TABLE IF EXISTS foo")
+        c.execute("CREATE TABLE foo(i INT)")
+
+        # the trailing comment must not swallow the next statement of the batch
+        ret = c.executemany("INSERT INTO foo VALUES (%s) -- comment", [(i,) for i in range(10)])
+        self.assertEqual(ret, 10)
+        self.assertEqual(c.rowcount, 10)
+
+        # spread the statements over several batches
+        batch_length = pymonetdb.sql.cursors.EXECUTEMANY_BATCH_LENGTH
+        pymonetdb.sql.cursors.EXECUTEMANY_BATCH_LENGTH = 50
+        try:
+            ret = c.executemany("DELETE FROM foo WHERE i = %s", [(i,) for i in range(0, 20, 2)])
+        finally:
+            pymonetdb.sql.cursors.EXECUTEMANY_BATCH_LENGTH = batch_length
+        self.assertEqual(ret, 5)
+
+        c.execute("SELECT COUNT(*) FROM foo")
+        self.assertEqual(c.fetchone()[0], 5)
+
+        conn.rollback()
@@ -21,3 +21,24 @@ class TestMapi(TestCase):
             data = self.conn.cmd(query)
             cleaned = [i for i in data.split('\n') if i and not i[0] in '%&']
             self.assertEqual(len(cleaned), size)
+
+    def test_cmd_iter(self):
+        query = 'sselect * from tables t1, tables t2;'
+        self.conn.set_reply_size(1000)
+        expected = [i for i in self.conn.cmd(query).split('\n') if i[:1] != '&']
+        lines = [i for batch in self.conn.cmd_iter(query) for i in batch if i[:1] != '&']
+        self.assertEqual(expected, lines)
+
+        # closing early must leave the connection usable
+        it = self.conn.cmd_iter(query)
+        next(it)
+        it.close()
+        lines = [i for i in self.conn.cmd(query).split('\n') if i[:1] != '&']
+        self.assertEqual(expected, lines)
+
+    def test_cmd_pipelined(self):
+        responses = self.conn.cmd_pipelined(['sselect 1;', 'sselect 2;'])
+        tuples = [[i for i in r.split('\n') if i.startswith('[')] for r in responses]
+        self.assertEqual([['[ 1\t]'], ['[ 2\t]']], tuples)
+        # the connection is still in sync
+        self.assertIn('[ 3\t]', self.conn.cmd('sselect 3;'))
@@ -35,6 +35,20 @@ class TestPythonize(unittest.TestCase):
         result2 = pymonetdb.sql.pythonize.convert(input2, pymonetdb.types.BLOB)
         self.assertEqual(output2, result2)
 
+    def test_convert_column(self):
+        data = ['1', 'NULL', '-3']
+        result = pymonetdb.sql.pythonize.convert_column(data, pymonetdb.types.INT)
+        self.assertEqual([pymonetdb.sql.pythonize.convert(x, pymonetdb.types.INT) for x in data], result)
+        self.assertEqual([1, None, -3], result)
+
+        result = pymonetdb.sql.pythonize.convert_column(['"a\\tb"', 'NULL'], pymonetdb.types.VARCHAR)
+        self.assertEqual(['a\tb', None], result)
+
+        result = pymonetdb.sql.pythonize.convert_column(['NULL'], 'nosuchtype')
+        self.assertEqual([None], result)
+        with self.assertRaises(pymonetdb.ProgrammingError):
+            pymonetdb.sql.pythonize.convert_column(['1'], 'nosuchtype')
+
     def test_month_interval(self):
         self.cursor.execute('CREATE TEMPORARY TABLE foo (i INTERVAL MONTH)')
         self.cursor.execute('INSERT INTO foo VALUES (INTERVAL \'2\' YEAR)')